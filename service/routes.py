@@ -118,7 +118,19 @@ def list_products():
         product_list = Product.find_by_category(filter_category_value).all()
     elif filter_available:
         app.logger.info("Fetch products with availability %s from database.", filter_available)
-        product_list = Product.find_by_availability(filter_available).all()
+        # Query parameters are strings, the database column is a boolean.
+        # Accept the same literals as a PostgreSQL boolean.
+        filter_available_value = filter_available.strip().lower()
+        if filter_available_value in ["true", "t", "yes", "y", "on", "1"]:
+            product_list = Product.find_by_availability(True).all()
+        elif filter_available_value in ["false", "f", "no", "n", "off", "0"]:
+            product_list = Product.find_by_availability(False).all()
+        else:
+            app.logger.error("Invalid availability: %s", filter_available)
+            abort(
+                status.HTTP_400_BAD_REQUEST,
+                f"Invalid value for available: {filter_available}",
+            )
     else:
         app.logger.info("Fetch all products from database")
         product_list = Product.all()